@@ -0,0 +1,109 @@
+"""Startup-time benchmark for the lightweight CLI commands.
+
+Runs each command under `python -X importtime` and checks that the summed
+import time stays within budget and that none of the heavy pipeline
+dependencies are pulled in.
+
+Usage:
+    python -m src.bench_startup [--budget-ms 60] [--runs 5]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from .cli import _positive_int
+
+# Commands that must not touch scenedetect/OpenCV or the HTTP stack
+LIGHTWEIGHT_COMMANDS = [
+    ["--help"],
+    ["segment", "--help"],
+    ["upload", "--help"],
+    ["status", "--help"],
+    ["reconcile", "--help"],
+    ["verify", "--help"],
+    ["run", "--help"],
+]
+
+HEAVY_MODULES = ("scenedetect", "cv2", "numpy", "requests", "urllib3", "dotenv")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_imports(command: List[str]) -> Tuple[float, Dict[str, int]]:
+    """Run `python -m src <command>` with -X importtime.
+
+    Returns the total import time in milliseconds and a mapping of
+    top-level imported module names to their self time in microseconds.
+    Raises RuntimeError if the command exits with a non-zero status.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src"] + command,
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"exited with status {result.returncode}:\n" + "\n".join(errors))
+
+    modules: Dict[str, int] = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self us> | <cumulative us> | <module>"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        self_us = int(self_us.strip())
+        total_us += self_us
+        modules[name.strip()] = modules.get(name.strip(), 0) + self_us
+
+    return total_us / 1000, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup import time.")
+    parser.add_argument("--budget-ms", type=float, default=60.0,
+                        help="Maximum total import time per command in milliseconds (default: 60)")
+    parser.add_argument("--runs", type=_positive_int, default=5,
+                        help="Number of runs per command; the fastest is reported (default: 5)")
+    args = parser.parse_args()
+
+    failures = []
+    for command in LIGHTWEIGHT_COMMANDS:
+        label = " ".join(command)
+        best_ms = None
+        heavy = set()
+        try:
+            for _ in range(args.runs):
+                total_ms, modules = measure_imports(command)
+                best_ms = total_ms if best_ms is None else min(best_ms, total_ms)
+                heavy.update(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+        except RuntimeError as e:
+            failures.append(f"{label}: {e}")
+            print(f"{label:<16} {'-':>6}   (FAIL)")
+            continue
+
+        status = "OK"
+        if heavy:
+            status = "FAIL"
+            failures.append(f"{label}: imported heavy modules {sorted(heavy)}")
+        if best_ms > args.budget_ms:
+            status = "FAIL"
+            failures.append(f"{label}: {best_ms:.1f}ms exceeds budget of {args.budget_ms:.1f}ms")
+        print(f"{label:<16} {best_ms:6.1f}ms ({status})")
+
+    if failures:
+        print("\nStartup benchmark failed:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    print(f"\nAll commands within {args.budget_ms:.1f}ms import budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""Command line entry point for the segmenting and Mux pipeline.
+
+Usage:
+    python -m src segment VIDEO_PATH OUTPUT_DIR
+    python -m src upload SEGMENTS_DIR OUTPUT_FILE
+    python -m src status ASSET_ID [ASSET_ID ...]
+    python -m src reconcile SEASON_FILE_OR_DIR [...] [--patch]
+    python -m src verify
+    python -m src run VIDEO_PATH SEGMENTS_DIR OUTPUT_FILE
+
+Heavy dependencies (scenedetect/OpenCV, requests, python-dotenv) are only
+imported inside the subcommand that needs them, so `--help` and argument
+errors stay fast. Keep module-level imports in this file to the stdlib.
+"""
+import argparse
+from typing import List, Optional
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _add_segment_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--threshold", type=float, default=30.0,
+                        help="Scene detection threshold (higher = less sensitive)")
+    parser.add_argument("--min-duration", type=float, default=45,
+                        help="Minimum segment duration in seconds (default: 45)")
+    parser.add_argument("--max-duration", type=float, default=90,
+                        help="Maximum segment duration in seconds (default: 90)")
+
+
+def _add_mux_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--mux-token-id", help="Mux API Token ID (optional if set in .env)")
+    parser.add_argument("--mux-token-secret", help="Mux API Token Secret (optional if set in .env)")
+
+
+def _segment(args: argparse.Namespace) -> int:
+    from .preprocessing.video_segmenter import segment_video
+
+    segment_video(args.video_path, args.output_dir, args.threshold,
+                  args.min_duration, args.max_duration)
+    return 0
+
+
+def _upload(args: argparse.Namespace) -> int:
+    from .processing.mux_proc import MuxProcessor
+
+    processor = MuxProcessor(args.mux_token_id, args.mux_token_secret)
+    season_data = processor.process_season(args.segments_dir, args.output_file)
+    return 1 if season_data["errors"] else 0
+
+
+def _status(args: argparse.Namespace) -> int:
+    import requests
+    from .processing.mux_proc import MuxProcessor
+
+    processor = MuxProcessor(args.mux_token_id, args.mux_token_secret)
+    exit_code = 0
+    for asset_id in args.asset_ids:
+        try:
+            asset_data = processor.get_asset_status(asset_id)
+        except requests.exceptions.HTTPError as e:
+            # Anything other than a 404 (bad credentials, rate limit, outage)
+            # applies to every asset, so stop instead of reporting each one
+            if e.response.status_code != 404:
+                raise
+            print(f"{asset_id}: not found ({e.response.status_code})")
+            exit_code = 1
+            continue
+        status = asset_data.get("status")
+        playback_ids = [p["id"] for p in asset_data.get("playback_ids", [])]
+        print(f"{asset_id}: {status} (duration: {asset_data.get('duration')}, "
+              f"playback IDs: {', '.join(playback_ids) or 'none'})")
+        if status != "ready":
+            exit_code = 1
+    return exit_code
+
+
+def _reconcile(args: argparse.Namespace) -> int:
+    from .processing.mux_proc import MuxProcessor
+    from .processing.season_reconciler import reconcile_seasons
+
+    processor = MuxProcessor(args.mux_token_id, args.mux_token_secret)
+    report = reconcile_seasons(processor, args.season_paths, args.tolerance,
+                               args.patch, args.max_workers)
+    return 1 if any(report.values()) else 0
+
+
+def _verify(args: argparse.Namespace) -> int:
+    from .processing.verify_mux_credentials import verify_mux_credentials
+
+    return 0 if verify_mux_credentials() else 1
+
+
+def _run(args: argparse.Namespace) -> int:
+    _segment(argparse.Namespace(video_path=args.video_path, output_dir=args.segments_dir,
+                                threshold=args.threshold, min_duration=args.min_duration,
+                                max_duration=args.max_duration))
+    return _upload(args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Segment movies into episodes and publish them to Mux."
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+    subparsers.required = True
+
+    segment = subparsers.add_parser("segment", help="Split a video into episode segments")
+    segment.add_argument("video_path", help="Path to input video")
+    segment.add_argument("output_dir", help="Directory to save segments and timestamps.json")
+    _add_segment_args(segment)
+    segment.set_defaults(func=_segment)
+
+    upload = subparsers.add_parser("upload", help="Upload segments to Mux and write season metadata")
+    upload.add_argument("segments_dir", help="Directory containing video segments")
+    upload.add_argument("output_file", help="Path to save season metadata")
+    _add_mux_args(upload)
+    upload.set_defaults(func=_upload)
+
+    status = subparsers.add_parser("status", help="Show the Mux status of one or more assets")
+    status.add_argument("asset_ids", nargs="+", metavar="ASSET_ID", help="Mux asset ID")
+    _add_mux_args(status)
+    status.set_defaults(func=_status)
+
+    reconcile = subparsers.add_parser(
+        "reconcile", help="Check season files against the Mux asset list"
+    )
+    reconcile.add_argument("season_paths", nargs="+", metavar="SEASON_FILE_OR_DIR",
+                           help="Season metadata file, or directory of season files")
+    reconcile.add_argument("--tolerance", type=float, default=1.0,
+                           help="Allowed duration mismatch in seconds (default: 1.0)")
+    reconcile.add_argument("--patch", action="store_true",
+                           help="Update the season files in place with the current Mux state")
+    reconcile.add_argument("--max-workers", type=_positive_int, default=4,
+                           help="Number of asset list pages to fetch concurrently (default: 4)")
+    _add_mux_args(reconcile)
+    reconcile.set_defaults(func=_reconcile)
+
+    verify = subparsers.add_parser("verify", help="Verify Mux API credentials")
+    verify.set_defaults(func=_verify)
+
+    run = subparsers.add_parser("run", help="Segment a video and upload the segments to Mux")
+    run.add_argument("video_path", help="Path to input video")
+    run.add_argument("segments_dir", help="Directory to save segments and timestamps.json")
+    run.add_argument("output_file", help="Path to save season metadata")
+    _add_segment_args(run)
+    _add_mux_args(run)
+    run.set_defaults(func=_run)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
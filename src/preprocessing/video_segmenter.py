@@ -94,9 +94,4 @@ def segment_video(video_path, output_dir, threshold=30.0, min_duration=45, max_d
         duration = ts['duration']
         status = "OK" if min_duration <= duration <= max_duration else "WARNING"
         print(f"Segment {i}: {duration:.1f}s ({status})")
-    print(f"Timestamps saved to {timestamps_file}")
-
-if __name__ == "__main__":
-    video_path = "data/input/tears_of_steel_720p.mov"
-    output_dir = "data/segments/tears_of_steel"
-    segment_video(video_path, output_dir)
\ No newline at end of file
+    print(f"Timestamps saved to {timestamps_file}")
\ No newline at end of file
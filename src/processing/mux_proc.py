@@ -2,6 +2,7 @@ import os
 import json
 from typing import Dict, List, Optional, Tuple, cast
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -181,6 +182,38 @@ class MuxProcessor:
         response.raise_for_status()
         return response.json()["data"]
 
+    def get_asset_page(self, page: int, limit: int = 100) -> List[Dict]:
+        """Fetch a single page of the asset list."""
+        response = requests.get(
+            f"{self.base_url}/assets",
+            auth=self.auth,
+            params={"page": page, "limit": limit}
+        )
+        response.raise_for_status()
+        return response.json()["data"]
+
+    def list_assets(self, limit: int = 100, max_workers: int = 4) -> List[Dict]:
+        """Return every asset in the environment.
+
+        Pages are fetched `max_workers` at a time; listing stops at the first
+        batch containing a short page.
+        """
+        assets: List[Dict] = []
+        page = 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                pages = range(page, page + max_workers)
+                results = list(executor.map(lambda p: self.get_asset_page(p, limit), pages))
+                for data in results:
+                    assets.extend(data)
+
+                print(f"Fetched asset pages {page}-{page + max_workers - 1} ({len(assets)} assets so far)")
+
+                if any(len(data) < limit for data in results):
+                    return assets
+                page += max_workers
+
     def process_season(self, segments_dir: str, output_file: str) -> Dict:
         """Process all video segments in a directory and create a season metadata file."""
         segment_files = sorted(Path(segments_dir).glob("*.mp4"))
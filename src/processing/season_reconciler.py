@@ -0,0 +1,172 @@
+import os
+import json
+from pathlib import Path
+from typing import Dict, List
+import requests
+
+
+def load_segment_durations(season_data: Dict) -> Dict[int, float]:
+    """Map segment index to duration, preferring the season's timestamps.json."""
+    durations = {}
+
+    timestamps_file = season_data.get("timestamps_source")
+    if timestamps_file and os.path.exists(timestamps_file):
+        with open(timestamps_file, "r") as f:
+            for segment in json.load(f).get("segments", []):
+                durations[segment["segment"]] = segment["duration"]
+        return durations
+
+    # Fall back to the timestamps copied into each episode at upload time
+    for episode in season_data.get("episodes", []):
+        segment = episode.get("timestamps") or {}
+        if "segment" in segment and "duration" in segment:
+            durations[segment["segment"]] = segment["duration"]
+    return durations
+
+
+def find_season_files(paths: List[str]) -> List[Path]:
+    """Expand directories into the season JSON files they contain."""
+    season_files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            season_files.extend(sorted(path.glob("*.json")))
+        else:
+            season_files.append(path)
+    return season_files
+
+
+def reconcile_season(season_data: Dict, assets_by_id: Dict[str, Dict],
+                     tolerance: float = 1.0, patch: bool = False) -> List[Dict]:
+    """Compare a season's episodes against the listed Mux assets.
+
+    Args:
+        season_data: Parsed season metadata file
+        assets_by_id: Mux asset list keyed by asset ID
+        tolerance: Allowed difference in seconds between the Mux asset duration
+            and the segment duration from timestamps.json
+        patch: Update episode status, playback ID and duration in place
+
+    Returns:
+        A list of issues, one per problem found.
+    """
+    durations = load_segment_durations(season_data)
+    issues = []
+
+    for episode in season_data.get("episodes", []):
+        number = episode["episode_number"]
+        asset_id = episode.get("asset_id")
+        asset = assets_by_id.get(asset_id)
+
+        if asset is None:
+            issues.append({"episode_number": number, "asset_id": asset_id, "issue": "missing",
+                           "detail": "asset not found in Mux"})
+            if patch:
+                # Keep the stored playback ID; it is the only record of it
+                episode["status"] = "missing"
+            continue
+
+        status = asset.get("status")
+        playback_ids = [p["id"] for p in asset.get("playback_ids", [])]
+
+        if status == "errored":
+            issues.append({"episode_number": number, "asset_id": asset_id, "issue": "errored",
+                           "detail": str(asset.get("errors", {}))})
+        elif status != "ready":
+            issues.append({"episode_number": number, "asset_id": asset_id, "issue": "not_ready",
+                           "detail": f"status is {status}"})
+
+        if not playback_ids:
+            issues.append({"episode_number": number, "asset_id": asset_id, "issue": "no_playback_ids",
+                           "detail": "asset has no playback IDs"})
+        elif episode.get("playback_id") and episode["playback_id"] not in playback_ids:
+            issues.append({"episode_number": number, "asset_id": asset_id, "issue": "missing_playback_id",
+                           "detail": f"playback ID {episode['playback_id']} not on asset"})
+
+        expected = durations.get(number - 1)
+        actual = asset.get("duration")
+        if expected is not None and actual is not None and abs(actual - expected) > tolerance:
+            issues.append({"episode_number": number, "asset_id": asset_id, "issue": "duration_mismatch",
+                           "detail": f"Mux duration {actual:.2f}s, segment duration {expected:.2f}s"})
+
+        if patch:
+            episode["status"] = status
+            # Only overwrite stored values that Mux can replace; a still-valid
+            # playback ID and a known duration are kept as they are
+            if actual is not None:
+                episode["duration"] = actual
+            if playback_ids and episode.get("playback_id") not in playback_ids:
+                episode["playback_id"] = playback_ids[0]
+
+    return issues
+
+
+def confirm_missing_assets(processor, asset_ids: List[str], assets_by_id: Dict[str, Dict]) -> None:
+    """Look up asset IDs absent from the listing one by one.
+
+    The paginated listing can skip assets when new ones are created while it
+    runs, so an asset only counts as missing once a direct lookup returns 404.
+    Assets found this way are added to `assets_by_id`.
+    """
+    for asset_id in asset_ids:
+        if asset_id in assets_by_id:
+            continue
+        try:
+            assets_by_id[asset_id] = processor.get_asset_status(asset_id)
+            print(f"Asset {asset_id} was not in the listing but still exists")
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code != 404:
+                raise
+
+
+def reconcile_seasons(processor, season_paths: List[str], tolerance: float = 1.0,
+                      patch: bool = False, max_workers: int = 4) -> Dict[str, List[Dict]]:
+    """Reconcile every season file against a single listing of the Mux assets.
+
+    Args:
+        processor: MuxProcessor used to list the assets
+        season_paths: Season JSON files or directories containing them
+        tolerance: Allowed duration difference in seconds
+        patch: Rewrite the season files with the current Mux state
+        max_workers: Number of asset list pages to fetch concurrently
+
+    Returns:
+        Issues keyed by season file path.
+    """
+    season_files = find_season_files(season_paths)
+    if not season_files:
+        raise ValueError(f"No season files found in {', '.join(season_paths)}")
+
+    print("Listing Mux assets...")
+    assets_by_id = {asset["id"]: asset for asset in processor.list_assets(max_workers=max_workers)}
+    print(f"Found {len(assets_by_id)} assets in Mux")
+
+    seasons = {}
+    for season_file in season_files:
+        with open(season_file, "r") as f:
+            season_data = json.load(f)
+
+        if "episodes" not in season_data:
+            print(f"\nSkipping {season_file}: not a season file")
+            continue
+        seasons[season_file] = season_data
+
+    asset_ids = [episode.get("asset_id") for season_data in seasons.values()
+                 for episode in season_data["episodes"] if episode.get("asset_id")]
+    confirm_missing_assets(processor, asset_ids, assets_by_id)
+
+    report = {}
+    for season_file, season_data in seasons.items():
+        issues = reconcile_season(season_data, assets_by_id, tolerance, patch)
+        report[str(season_file)] = issues
+
+        print(f"\n{season_file}: {len(season_data['episodes'])} episodes, {len(issues)} issues")
+        for issue in issues:
+            print(f"  Episode {issue['episode_number']} ({issue['asset_id']}): "
+                  f"{issue['issue']} - {issue['detail']}")
+
+        if patch and issues:
+            with open(season_file, "w") as f:
+                json.dump(season_data, f, indent=2)
+            print(f"  Patched {season_file}")
+
+    return report